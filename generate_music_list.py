@@ -1,19 +1,58 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import argparse
 import re
 import csv
-from tinytag import TinyTag
-from mutagen.easyid3 import EasyID3
-from mutagen.flac import FLAC
-from mutagen.id3 import ID3, APIC
-from mutagen.mp3 import MP3
-import base64
-
-def parse_filename(filename):
-    """Parse filename with more flexible matching and validation."""
-    name, ext = os.path.splitext(filename)
+import json
+import mutagen
+import functools
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from mutagen.id3 import ID3
+from tinytag import TinyTag, TinyTagException
+
+_BPM_STRIP = re.compile(r'[^\d.]')
+_FS_SANITIZE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_EXT_SET = frozenset(['.mp3', '.flac', '.wav', '.aiff', '.aac'])
+_OUTPUT_BUFFER_SIZE = 1 << 20
+_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'beatrove', 'tracks.json')
+_CACHE_VERSION = 2
+_ENERGY_KEYS = frozenset({'energylevel', 'energy_level', 'energy'})
+_LABEL_KEYS = frozenset({'record label', 'recordlabel', 'record_label', 'label', 'publisher', 'organization'})
+# Vorbis keys in the order they take priority when a FLAC file has several
+_FLAC_ENERGY_KEYS = ('energylevel', 'energy_level', 'energy')
+_FLAC_LABEL_KEYS = ('label', 'publisher', 'organization', 'record_label', 'recordlabel', 'record label')
+_FLAC_WANTED = frozenset(_FLAC_ENERGY_KEYS + _FLAC_LABEL_KEYS)
+_INFO_TAG_EXTS = frozenset({'.wav', '.aiff'})  # Formats that may carry tags outside an ID3 chunk
+_WANTED_TXXX = {**dict.fromkeys(_ENERGY_KEYS, 'energy'), **dict.fromkeys(_LABEL_KEYS, 'label')}
+
+class Track(NamedTuple):
+    """Track info collected for one audio file."""
+    artist: str
+    title: str
+    key: str
+    bpm: str
+    extension: str
+    duration: str
+    year: str
+    path: str
+    genre: str
+    energy: str
+    label: str
+    filename: str
+    artwork_path: str = ""
+
+def parse_filename(filename, ext):
+    """Parse filename with more flexible matching and validation.
+
+    ext is the filename's already lowercased extension.
+    """
+    name = filename[:len(filename) - len(ext)]
     
     # Try the expected format first: Artist - Title - Key - BPM
     parts = name.split(" - ")
@@ -21,15 +60,20 @@ def parse_filename(filename):
     if len(parts) >= 4:
         artist, title, key, bpm = parts[0], parts[1], parts[2], parts[3]
         
-        # Validate BPM is numeric
-        bpm_clean = re.sub(r'[^\d.]', '', bpm.strip())
-        if bpm_clean and bpm_clean.replace('.', '').isdigit():
+        # Validate BPM is numeric; plain numbers like "124" skip the regex
+        bpm_s = bpm.strip()
+        if bpm_s.replace('.', '', 1).isdecimal():
+            bpm_valid = True
+        else:
+            bpm_clean = _BPM_STRIP.sub('', bpm_s)
+            bpm_valid = bool(bpm_clean) and bpm_clean.replace('.', '').isdigit()
+        if bpm_valid:
             return {
                 "artist": artist.strip(),
                 "title": title.strip(), 
                 "key": key.strip(),
-                "bpm": bpm.strip(),
-                "ext": ext.lower(),
+                "bpm": bpm_s,
+                "ext": ext,
                 "valid_format": True
             }
     
@@ -39,7 +83,7 @@ def parse_filename(filename):
         "title": name,  # Use full filename as title
         "key": "",
         "bpm": "",
-        "ext": ext.lower(),
+        "ext": ext,
         "valid_format": False
     }
 
@@ -50,46 +94,61 @@ def format_duration(seconds):
     m, s = divmod(int(seconds), 60)
     return f"{m}:{s:02}"
 
-def extract_cover_art(filepath, output_dir=None, artist=None, title=None):
-    """Extract cover art from audio file and save as image."""
-    if not output_dir:
+def _image_format(mime):
+    """Map an embedded picture MIME type to a file extension."""
+    return 'png' if mime == 'image/png' else 'jpg'
+
+def _extract_mp3_art(mf):
+    """Return (data, format) of the first APIC frame, or (None, None)."""
+    # Extract from MP3 using ID3 tags
+    if mf.tags:
+        for tag in mf.tags.getall('APIC'):
+            return tag.data, _image_format(tag.mime)
+    return None, None
+
+def _extract_flac_art(mf):
+    """Return (data, format) of the first FLAC picture, or (None, None)."""
+    if mf.pictures:
+        picture = mf.pictures[0]
+        return picture.data, _image_format(picture.mime)
+    return None, None
+
+_ART_READERS = {'.mp3': _extract_mp3_art, '.flac': _extract_flac_art}
+
+def _write_queued_artwork(artwork_path, artwork_data, failed):
+    """Write one queued artwork item, recording the path in failed if it can't be written."""
+    try:
+        with open(artwork_path, 'wb') as f:
+            f.write(artwork_data)
+        failed.discard(artwork_path)
+    except Exception as e:
+        failed.add(artwork_path)
+        print(f"Warning: Could not write artwork {os.path.basename(artwork_path)}: {str(e)}")
+
+def _artwork_writer(artwork_queue, failed):
+    """Write queued (path, data) artwork items until a None sentinel arrives.
+
+    Paths whose last write failed are collected in the failed set, so the
+    caller can drop them from the track list once the writer has finished.
+    """
+    while True:
+        item = artwork_queue.get()
+        if item is None:
+            break
+        _write_queued_artwork(*item, failed)
+
+def extract_cover_art(filepath, mf, output_dir=None, artist=None, title=None, ext=None, artwork_queue=None):
+    """Extract cover art from audio file and save as image.
+
+    If artwork_queue is given, the image is handed to the writer thread
+    instead of being written inline. output_dir must already exist.
+    """
+    if not output_dir or mf is None:
         return None
 
     try:
-        ext = os.path.splitext(filepath)[1].lower()
-        artwork_data = None
-        image_format = 'jpg'  # default
-
-        if ext == '.mp3':
-            # Extract from MP3 using ID3 tags
-            try:
-                audio = MP3(filepath, ID3=ID3)
-                if audio.tags:
-                    for tag in audio.tags.getall('APIC'):
-                        artwork_data = tag.data
-                        # Determine format from MIME type
-                        if tag.mime == 'image/jpeg':
-                            image_format = 'jpg'
-                        elif tag.mime == 'image/png':
-                            image_format = 'png'
-                        break
-            except Exception:
-                pass
-
-        elif ext == '.flac':
-            # Extract from FLAC
-            try:
-                audio = FLAC(filepath)
-                if audio.pictures:
-                    picture = audio.pictures[0]
-                    artwork_data = picture.data
-                    # Determine format from MIME type
-                    if picture.mime == 'image/jpeg':
-                        image_format = 'jpg'
-                    elif picture.mime == 'image/png':
-                        image_format = 'png'
-            except Exception:
-                pass
+        reader = _ART_READERS.get(ext)
+        artwork_data, image_format = reader(mf) if reader else (None, None)
 
         # Save the artwork if found
         if artwork_data:
@@ -101,14 +160,19 @@ def extract_cover_art(filepath, output_dir=None, artist=None, title=None):
                 filename = os.path.splitext(os.path.basename(filepath))[0]
 
             # Clean filename for filesystem
-            filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+            filename = _FS_SANITIZE.sub('_', filename)
             artwork_path = os.path.join(output_dir, f"{filename}.{image_format}")
 
-            # Create output directory if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
-
-            with open(artwork_path, 'wb') as f:
-                f.write(artwork_data)
+            queued = False
+            if artwork_queue is not None:
+                try:
+                    artwork_queue.put_nowait((artwork_path, artwork_data))
+                    queued = True
+                except queue.Full:
+                    pass  # Never wait on the writer thread; write inline when it falls behind
+            if not queued:
+                with open(artwork_path, 'wb') as f:
+                    f.write(artwork_data)
 
             return artwork_path
 
@@ -116,175 +180,65 @@ def extract_cover_art(filepath, output_dir=None, artist=None, title=None):
         print(f"Warning: Could not extract artwork from {os.path.basename(filepath)}: {str(e)}")
 
     return None
-    """Read custom fields like ENERGYLEVEL and RECORD LABEL using Mutagen."""
-    ext = os.path.splitext(filepath)[1].lower()
-    energy = ""
-    label = ""
-    
-    try:
-        if ext == '.mp3':
-            tags = EasyID3(filepath)
-            # Try common variations for energy level
-            for field in ['energylevel', 'energy_level', 'energy']:
-                if field in tags and tags[field] and not energy:
-                    energy = tags[field][0]
-            
-            # Try common variations for record label
-            for field in ['label', 'publisher', 'organization']:
-                if field in tags and tags[field] and not label:
-                    label = tags[field][0]
-            
-            # Try raw ID3 tags for custom fields
-            try:
-                from mutagen.id3 import ID3, TXXX
-                id3 = ID3(filepath)
-                for frame in id3.getall('TXXX'):
-                    desc_lower = frame.desc.lower()
-                    if not energy and desc_lower in ['energylevel', 'energy_level', 'energy']:
-                        energy = frame.text[0] if frame.text else ""
-                    if not label and desc_lower in ['record label', 'recordlabel', 'label', 'publisher']:
-                        label = frame.text[0] if frame.text else ""
-            except:
-                pass
-                    
-        elif ext == '.flac':
-            tags = FLAC(filepath)
-            if tags and tags.tags:
-                # FLAC uses Vorbis comments
-                for field in ['energylevel', 'energy_level', 'energy']:
-                    field_upper = field.upper()
-                    if field_upper in tags.tags and not energy:
-                        energy = tags.tags[field_upper][0]
-                
-                for field in ['label', 'publisher', 'organization', 'record_label', 'recordlabel']:
-                    field_upper = field.upper()
-                    if field_upper in tags.tags and not label:
-                        label = tags.tags[field_upper][0]
-                        
-    except Exception:
-        pass
-    
-    return energy.strip() if energy else "", label.strip() if label else ""
 
-def get_custom_fields(filepath):
-    """Read custom fields like ENERGYLEVEL and RECORD LABEL using Mutagen."""
-    ext = os.path.splitext(filepath)[1].lower()
+def _read_mp3_custom(tags):
+    """Read energy and label from ID3 publisher and TXXX frames."""
     energy = ""
     label = ""
     
-    try:
-        if ext == '.mp3':
-            tags = EasyID3(filepath)
-            # Try common variations for energy level
-            for field in ['energylevel', 'energy_level', 'energy']:
-                if field in tags and tags[field] and not energy:
-                    energy = tags[field][0]
-            
-            # Try common variations for record label
-            for field in ['label', 'publisher', 'organization']:
-                if field in tags and tags[field] and not label:
-                    label = tags[field][0]
-            
-            # Try raw ID3 tags for custom fields
-            try:
-                from mutagen.id3 import ID3, TXXX
-                id3 = ID3(filepath)
-                for frame in id3.getall('TXXX'):
-                    desc_lower = frame.desc.lower()
-                    if not energy and desc_lower in ['energylevel', 'energy_level', 'energy']:
-                        energy = frame.text[0] if frame.text else ""
-                    if not label and desc_lower in ['record label', 'recordlabel', 'label', 'publisher']:
-                        label = frame.text[0] if frame.text else ""
-            except:
-                pass
-                    
-        elif ext == '.flac':
-            tags = FLAC(filepath)
-            if tags and tags.tags:
-                # FLAC uses Vorbis comments
-                for field in ['energylevel', 'energy_level', 'energy']:
-                    field_upper = field.upper()
-                    if field_upper in tags.tags and not energy:
-                        energy = tags.tags[field_upper][0]
-                
-                for field in ['label', 'publisher', 'organization', 'record_label', 'recordlabel']:
-                    field_upper = field.upper()
-                    if field_upper in tags.tags and not label:
-                        label = tags.tags[field_upper][0]
-                        
-    except Exception:
-        pass
-    
-    return energy.strip() if energy else "", label.strip() if label else ""
-
-def get_metadata_from_tags(filepath, parsed_info):
-    """Generate music list in specified format."""
-    tracks = []
-    skipped_files = []
+    # Publisher frame (EasyID3 'organization')
+    publisher = tags.get('TPUB')
+    if publisher and publisher.text:
+        label = publisher.text[0].strip()
     
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith(('.mp3', '.flac', '.wav', '.aiff', '.aac')):
-                filepath = os.path.abspath(os.path.join(root, filename))
-                
-                # Parse filename
-                parsed = parse_filename(filename)
-                
-                # Get metadata from tags
-                artist, title, duration, year, genre = get_metadata_from_tags(filepath, parsed)
-                
-                # Get custom fields
-                energy, label = get_custom_fields(filepath)
-                
-                # Warn about non-standard format files
-                if not parsed['valid_format']:
-                    skipped_files.append(f"Non-standard format: {filename}")
-                
-                # Build track info
-                track_data = {
-                    'filename': f"{artist} - {title} - {parsed['key']} - {parsed['bpm']}{parsed['ext']}",
-                    'artist': artist,
-                    'title': title,
-                    'key': parsed['key'],
-                    'bpm': parsed['bpm'],
-                    'extension': parsed['ext'],
-                    'duration': duration,
-                    'year': year,
-                    'path': filepath,
-                    'genre': genre,
-                    'energy': f"Energy {energy}" if energy else "",
-                    'label': f"{label}" if label else ""
-                }
-                
-                tracks.append(track_data)
+    # Try raw ID3 tags for custom fields
+    for frame in tags.getall('TXXX'):
+        target = _WANTED_TXXX.get(frame.desc.lower())
+        if target == 'energy' and not energy:
+            energy = frame.text[0].strip() if frame.text else ""
+        elif target == 'label' and not label:
+            label = frame.text[0].strip() if frame.text else ""
+        if energy and label:
+            break
     
-    # Sort tracks by artist, then title
-    tracks.sort(key=lambda x: (x['artist'].lower(), x['title'].lower()))
+    return energy, label
+
+def _read_flac_custom(tags):
+    """Read energy and label from FLAC Vorbis comments.
+
+    The first value of each wanted key is collected in one pass; the field is
+    then taken from the highest-priority key that has a value.
+    """
+    found = {}
+    for key, value in tags:
+        key_lower = key.lower()
+        if key_lower in _FLAC_WANTED and key_lower not in found:
+            found[key_lower] = value
     
-    # Write output
-    if csv_format:
-        write_csv_output(tracks, output_file, include_artwork=extract_artwork)
-    else:
-        write_text_output(tracks, output_file, include_artwork=extract_artwork)
+    energy = next((found[k] for k in _FLAC_ENERGY_KEYS if found.get(k)), "")
+    label = next((found[k] for k in _FLAC_LABEL_KEYS if found.get(k)), "")
     
-    # Print summary
-    print(f"✅ Processed {len(tracks)} tracks")
-    print(f"📄 Output written to: {output_file}")
-    
-    if extract_artwork and artwork_dir:
-        artwork_count = sum(1 for track in tracks if track['artwork_path'])
-        print(f"🎨 Extracted {artwork_count} cover art images to: {artwork_dir}")
+    return energy.strip(), label.strip()
+
+_CUSTOM_READERS = {'.mp3': _read_mp3_custom, '.flac': _read_flac_custom}
+
+def get_custom_fields(filepath, mf, ext):
+    """Read custom fields like ENERGYLEVEL and RECORD LABEL using Mutagen.
+
+    Readers strip values as they extract them.
+    """
+    reader = _CUSTOM_READERS.get(ext)
+    if reader is None or mf is None or not mf.tags:
+        return "", ""
     
-    if skipped_files:
-        print(f"⚠️  {len(skipped_files)} files with non-standard naming:")
-        for skip in skipped_files[:10]:  # Show first 10
-            print(f"   {skip}")
-        if len(skipped_files) > 10:
-            print(f"   ... and {len(skipped_files) - 10} more")
+    try:
+        return reader(mf.tags)
+    except Exception:
+        return "", ""
 
 def write_csv_output(tracks, output_file, include_artwork=False):
     """Write tracks to CSV file."""
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         # Header
         if include_artwork:
@@ -292,81 +246,248 @@ def write_csv_output(tracks, output_file, include_artwork=False):
         else:
             writer.writerow(['Artist', 'Title', 'Key', 'BPM', 'Extension', 'Duration', 'Year', 'Path', 'Genre', 'Energy', 'Label'])
         
-        for track in tracks:
-            row = [
-                track['artist'], track['title'], track['key'], track['bpm'],
-                track['extension'], track['duration'], track['year'],
-                track['path'], track['genre'], track['energy'], track['label']
-            ]
-            if include_artwork:
-                row.append(track['artwork_path'])
-            writer.writerow(row)
+        rows = [
+            [
+                track.artist, track.title, track.key, track.bpm,
+                track.extension, track.duration, track.year,
+                track.path, track.genre, track.energy, track.label
+            ] + ([track.artwork_path] if include_artwork else [])
+            for track in tracks
+        ]
+        writer.writerows(rows)
+
+def _format_text_line(track, include_artwork=False):
+    """Format a single track as a ' - ' separated text line."""
+    parts = [track.filename]
+    if track.duration: parts.append(track.duration)
+    if track.year: parts.append(track.year)
+    parts.append(track.path)
+    if track.genre: parts.append(track.genre)
+    if track.energy: parts.append(track.energy)
+    if track.label: parts.append(track.label)
+    if include_artwork and track.artwork_path: 
+        parts.append(f"Artwork: {track.artwork_path}")
+    return " - ".join(parts)
 
 def write_text_output(tracks, output_file, include_artwork=False):
     """Write tracks to text file in your specified format."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for track in tracks:
-            parts = [track['filename']]
-            if track['duration']: parts.append(track['duration'])
-            if track['year']: parts.append(track['year'])
-            parts.append(track['path'])
-            if track['genre']: parts.append(track['genre'])
-            if track['energy']: parts.append(track['energy'])
-            if track['label']: parts.append(track['label'])
-            if include_artwork and track['artwork_path']: 
-                parts.append(f"Artwork: {track['artwork_path']}")
-            
-            f.write(" - ".join(parts) + "\n")
-
-def generate_list(directory, output_file, csv_format=False, extract_artwork=False, artwork_dir=None):
-    """Generate music list in specified format."""
+    lines = [_format_text_line(track, include_artwork) for track in tracks]
+    with open(output_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
+def load_track_cache(cache_file):
+    """Load cached track info keyed by path; returns {} if missing or stale."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != _CACHE_VERSION:
+        return {}
+    return data.get('tracks', {})
+
+def save_track_cache(cache, cache_file):
+    """Write cached track info, replacing the previous cache file atomically."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': _CACHE_VERSION, 'tracks': cache}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write track cache {cache_file}: {str(e)}")
+
+def _process_file(filepath, ext, cached=None, extract_artwork=False, artwork_dir=None, artwork_queue=None):
+    """Build track info for a single audio file.
+
+    ext is the lowercased extension found while walking the directory.
+    Returns a (track_data, skip_reason, cache_entry) tuple; skip_reason is
+    None when the filename follows the standard format. If cached matches the
+    file's current mtime and size, its track info is reused without parsing.
+    """
+    try:
+        st = os.stat(filepath)
+        stamp = [st.st_mtime_ns, st.st_size, artwork_dir if extract_artwork else None]
+    except OSError:
+        stamp = None
+
+    if cached and stamp and cached.get('stamp') == stamp:
+        try:
+            track_data = Track(**cached['track'])
+        except TypeError:
+            track_data = None  # Entry written with a different set of fields
+        if track_data and (not track_data.artwork_path or os.path.exists(track_data.artwork_path)):
+            return track_data, cached['skip_reason'], cached
+
+    filename = os.path.basename(filepath)
+
+    # Parse filename
+    parsed = parse_filename(filename, ext)
+
+    # Open the file once and share the parsed tags with every reader
+    mf = _read_all_metadata(filepath)
+
+    # Get metadata from tags
+    artist, title, duration, year, genre = get_metadata_from_tags(filepath, mf, parsed, ext)
+
+    # Get custom fields
+    energy, label = get_custom_fields(filepath, mf, ext)
+
+    # Extract cover art if requested
+    artwork_path = None
+    if extract_artwork and artwork_dir:
+        artwork_path = extract_cover_art(filepath, mf, artwork_dir, artist, title, ext=ext,
+                                         artwork_queue=artwork_queue)
+
+    # Warn about non-standard format files
+    skip_reason = None
+    if not parsed['valid_format']:
+        skip_reason = f"Non-standard format: {filename}"
+
+    # Build track info
+    track_data = Track(
+        filename=f"{artist} - {title} - {parsed['key']} - {parsed['bpm']}{parsed['ext']}",
+        artist=artist,
+        title=title,
+        key=parsed['key'],
+        bpm=parsed['bpm'],
+        extension=parsed['ext'],
+        duration=duration,
+        year=year,
+        path=filepath,
+        genre=genre,
+        energy=f"Energy {energy}" if energy else "",
+        label=f"{label}" if label else "",
+        artwork_path=artwork_path if artwork_path else ""
+    )
+
+    cache_entry = None
+    if stamp:
+        cache_entry = {'stamp': stamp, 'track': track_data._asdict(), 'skip_reason': skip_reason}
+
+    return track_data, skip_reason, cache_entry
+
+def _iter_audio_files(directory):
+    """Yield (path, lowercased extension) for audio files below directory."""
+    stack = [directory]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    # Extensions are 4 (.mp3) or 5 (.flac) characters long
+                    name = entry.name
+                    ext = name[-4:].lower()
+                    if ext not in _EXT_SET:
+                        ext = name[-5:].lower()
+                    if ext in _EXT_SET:
+                        yield entry.path, ext
+        except OSError:
+            pass  # Skip unreadable directories, like os.walk does
+        # Visit subdirectories in listing order, matching os.walk
+        stack.extend(reversed(subdirs))
+
+def generate_list(directory, output_file, csv_format=False, extract_artwork=False, artwork_dir=None,
+                  cache_file=None, jobs=None):
+    """Generate music list in specified format.
+
+    With jobs > 1, files are parsed in that many worker processes instead of
+    threads, for scans where tag parsing rather than disk I/O is the bottleneck.
+    """
     tracks = []
     skipped_files = []
+    artwork_count = 0
+    
+    # main() creates the artwork directory once, before any track is processed
+    if extract_artwork and artwork_dir:
+        assert os.path.isdir(artwork_dir), f"Artwork directory not found: {artwork_dir}"
+    
+    # Resolve once; DirEntry paths below an absolute root are already absolute
+    directory = os.path.abspath(directory)
+    
+    # Collect candidate files first so tag reading can run in parallel
+    paths = []
+    exts = []
+    for path, ext in _iter_audio_files(directory):
+        paths.append(path)
+        exts.append(ext)
+    
+    # Unchanged files are served from the cache instead of being reparsed
+    cache = load_track_cache(cache_file) if cache_file else {}
+    cached_entries = [cache.get(path) for path in paths]
+    
+    use_processes = jobs is not None and jobs > 1
+    
+    # Artwork is written on a background thread so it overlaps tag parsing;
+    # worker processes can't share the queue and write their artwork inline
+    artwork_queue = None
+    failed_artwork = set()
+    if extract_artwork and artwork_dir and not use_processes:
+        artwork_queue = queue.Queue(maxsize=256)
+        writer = threading.Thread(target=_artwork_writer, args=(artwork_queue, failed_artwork), daemon=True)
+        writer.start()
+    
+    process = functools.partial(_process_file, extract_artwork=extract_artwork, artwork_dir=artwork_dir,
+                                artwork_queue=artwork_queue)
+    try:
+        if use_processes:
+            # Processes sidestep the GIL when parsing is CPU bound (warm cache, SSD)
+            with multiprocessing.Pool(jobs) as pool:
+                results = pool.starmap(process, zip(paths, exts, cached_entries), chunksize=64)
+        else:
+            # Tag reading is I/O bound, so threads overlap the disk latency
+            max_workers = min(32, (os.cpu_count() or 4) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(process, paths, exts, cached_entries))
+        
+        for path, (track_data, skip_reason, cache_entry) in zip(paths, results):
+            tracks.append(track_data)
+            if track_data.artwork_path:
+                artwork_count += 1
+            if skip_reason:
+                skipped_files.append(skip_reason)
+            if cache_entry:
+                cache[path] = cache_entry
+    finally:
+        if artwork_queue is not None:
+            if writer.is_alive():
+                artwork_queue.put(None)
+            writer.join()
+            # If the writer died, write whatever it left queued from here
+            while True:
+                try:
+                    item = artwork_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    _write_queued_artwork(*item, failed_artwork)
+    
+    if failed_artwork:
+        # Queued writes that failed must not be listed, counted or cached
+        for i, track_data in enumerate(tracks):
+            if track_data.artwork_path in failed_artwork:
+                tracks[i] = track_data._replace(artwork_path="")
+                artwork_count -= 1
+                if track_data.path in cache:
+                    cache[track_data.path]['track']['artwork_path'] = ""
     
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith(('.mp3', '.flac', '.wav', '.aiff', '.aac')):
-                filepath = os.path.abspath(os.path.join(root, filename))
-                
-                # Parse filename
-                parsed = parse_filename(filename)
-                
-                # Get metadata from tags
-                artist, title, duration, year, genre = get_metadata_from_tags(filepath, parsed)
-                
-                # Get custom fields
-                energy, label = get_custom_fields(filepath)
-                
-                # Extract cover art if requested
-                artwork_path = None
-                if extract_artwork and artwork_dir:
-                    artwork_path = extract_cover_art(filepath, artwork_dir, artist, title)
-                
-                # Warn about non-standard format files
-                if not parsed['valid_format']:
-                    skipped_files.append(f"Non-standard format: {filename}")
-                
-                # Build track info
-                track_data = {
-                    'filename': f"{artist} - {title} - {parsed['key']} - {parsed['bpm']}{parsed['ext']}",
-                    'artist': artist,
-                    'title': title,
-                    'key': parsed['key'],
-                    'bpm': parsed['bpm'],
-                    'extension': parsed['ext'],
-                    'duration': duration,
-                    'year': year,
-                    'path': filepath,
-                    'genre': genre,
-                    'energy': f"Energy {energy}" if energy else "",
-                    'label': f"{label}" if label else "",
-                    'artwork_path': artwork_path if artwork_path else ""
-                }
-                
-                tracks.append(track_data)
+    if cache_file:
+        # Forget files that were removed from the scanned directory
+        prefix = os.path.join(directory, '')
+        seen = set(paths)
+        for path in [p for p in cache if p.startswith(prefix) and p not in seen]:
+            del cache[path]
+        save_track_cache(cache, cache_file)
     
-    # Sort tracks by artist, then title
-    tracks.sort(key=lambda x: (x['artist'].lower(), x['title'].lower()))
+    # Sort tracks by artist, then title (key= lowercases each track once, not per comparison)
+    tracks.sort(key=lambda t: (t.artist.lower(), t.title.lower()))
     
     # Write output
     if csv_format:
@@ -379,7 +500,6 @@ def generate_list(directory, output_file, csv_format=False, extract_artwork=Fals
     print(f"📄 Output written to: {output_file}")
     
     if extract_artwork and artwork_dir:
-        artwork_count = sum(1 for track in tracks if track['artwork_path'])
         print(f"🎨 Extracted {artwork_count} cover art images to: {artwork_dir}")
     
     if skipped_files:
@@ -389,18 +509,60 @@ def generate_list(directory, output_file, csv_format=False, extract_artwork=Fals
         if len(skipped_files) > 10:
             print(f"   ... and {len(skipped_files) - 10} more")
 
-def get_metadata_from_tags(filepath, parsed_info):
+def _read_all_metadata(filepath):
+    """Open the file once with Mutagen; returns None if it can't be parsed."""
+    try:
+        return mutagen.File(filepath)
+    except Exception:
+        return None
+
+def _tag_text(tags, frame_id, vorbis_key):
+    """Return the first value of an ID3 frame or Vorbis comment, or ""."""
+    if isinstance(tags, ID3):
+        frame = tags.get(frame_id)
+        if frame is None:
+            return ""
+        if frame_id == 'TCON':
+            values = frame.genres
+        else:
+            values = frame.text
+    else:
+        values = tags.get(vorbis_key)
+    return str(values[0]) if values else ""
+
+def _read_info_tags(filepath):
+    """Read WAV RIFF INFO / AIFF text chunks with TinyTag; returns (artist, title, year, genre)."""
+    try:
+        tag = TinyTag.get(filepath, duration=False)
+    except (OSError, TinyTagException):
+        return "", "", "", ""
+    return tag.artist or "", tag.title or "", str(tag.year) if tag.year else "", tag.genre or ""
+
+def get_metadata_from_tags(filepath, mf, parsed_info, ext=None):
     """Get metadata from file tags, use as fallback for missing filename info."""
     try:
-        tag = TinyTag.get(filepath)
+        if mf is None:
+            raise ValueError("unsupported or unreadable file")
+        
+        tag_artist = tag_title = tag_year = tag_genre = ""
+        if mf.tags:
+            tag_artist = _tag_text(mf.tags, 'TPE1', 'artist')
+            tag_title = _tag_text(mf.tags, 'TIT2', 'title')
+            tag_year = _tag_text(mf.tags, 'TDRC', 'date')
+            tag_genre = _tag_text(mf.tags, 'TCON', 'genre')
+        
+        # Mutagen only reads the ID3 chunk of WAV/AIFF files; without one,
+        # fall back to TinyTag, which also parses RIFF INFO and AIFF text chunks
+        if ext in _INFO_TAG_EXTS and not (tag_artist or tag_title or tag_year or tag_genre):
+            tag_artist, tag_title, tag_year, tag_genre = _read_info_tags(filepath)
         
         # Use tag info as fallback for missing filename data
-        artist = parsed_info['artist'] or (tag.artist if tag.artist else "Unknown Artist")
-        title = parsed_info['title'] or (tag.title if tag.title else os.path.splitext(os.path.basename(filepath))[0])
+        artist = parsed_info['artist'] or (tag_artist if tag_artist else "Unknown Artist")
+        title = parsed_info['title'] or (tag_title if tag_title else os.path.splitext(os.path.basename(filepath))[0])
         
-        duration = format_duration(tag.duration)
-        year = str(tag.year)[:4] if tag.year else ""
-        genre = tag.genre.strip() if tag.genre else ""
+        duration = format_duration(getattr(mf.info, 'length', None))
+        year = tag_year[:4]
+        genre = tag_genre.strip()
         
         return artist, title, duration, year, genre
         
@@ -408,6 +570,11 @@ def get_metadata_from_tags(filepath, parsed_info):
         return (parsed_info['artist'] or "Unknown Artist", 
                 parsed_info['title'], "", "", "")
 
+def _make_stdout_safe():
+    """Replace characters the console can't encode (e.g. emoji on cp1252) instead of raising."""
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='replace')
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate music tracklist from directory with robust format handling",
@@ -435,8 +602,13 @@ Example: Artbat - Horizon - 8A - 124.wav
                        help="Extract cover art from audio files (MP3/FLAC supported)")
     parser.add_argument("--artwork-dir", default="artwork",
                        help="Directory to save extracted artwork images (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N",
+                       help="Parse files in N worker processes instead of threads (helps when CPU bound)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help=f"Reparse every file instead of reusing unchanged results from {_CACHE_FILE}")
     
     args = parser.parse_args()
+    _make_stdout_safe()
     
     if not os.path.isdir(args.directory):
         print(f"❌ Directory not found: {args.directory}")
@@ -446,9 +618,16 @@ Example: Artbat - Horizon - 8A - 124.wav
     artwork_dir = None
     if args.extract_artwork:
         artwork_dir = os.path.abspath(args.artwork_dir)
+        try:
+            os.makedirs(artwork_dir, exist_ok=True)
+        except OSError as e:
+            print(f"❌ Could not create artwork directory {artwork_dir}: {str(e)}")
+            return
         print(f"🎨 Cover art will be extracted to: {artwork_dir}")
     
-    generate_list(args.directory, args.output, args.csv, args.extract_artwork, artwork_dir)
+    cache_file = None if args.no_cache else _CACHE_FILE
+    generate_list(args.directory, args.output, args.csv, args.extract_artwork, artwork_dir, cache_file,
+                  jobs=args.jobs)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
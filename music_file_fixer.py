@@ -2,115 +2,152 @@
 
 import os
 import re
+import sys
+import errno
+import ctypes
 import argparse
-from tinytag import TinyTag
+import functools
+import itertools
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+from tinytag import TinyTag, TinyTagException
 
-def is_correct_format(filename):
-    """Check if filename is already in correct format: Artist - Title - Key - BPM.ext"""
-    name, ext = os.path.splitext(filename)
-    parts = name.split(' - ')
+_BPM_RE = re.compile(r'\b(\d{2,3})\b')
+_KEYWORD_RE = re.compile(r'\b(\d{1,2}[AB])\b')
+_BPM_PART_RE = re.compile(r'^\d{2,3}$')
+_DIGITS_RE = re.compile(r'\d+')
+_AUDIO_EXTS = frozenset({'.mp3', '.flac', '.wav', '.aiff', '.aac'})
+_FLUSH_EVERY = 256  # Renames between stdout flushes in apply_renames
+
+def _is_key(value):
+    """Check for a musical key like 8A or 12B without using the regex engine."""
+    return len(value) in (2, 3) and value[-1] in 'AB' and value[:-1].isdecimal()
+
+def _is_bpm(value):
+    """Check that a BPM field contains a number, e.g. '124' or '128 BPM'."""
+    return any(c.isdecimal() for c in value)
+
+class ClassifyResult(NamedTuple):
+    """Everything process_directory needs to know about a filename.
+
+    bpm and key are the first BPM-like and key-like tokens in the name, and
+    are only searched for when the name is not already in the correct format.
+    """
+    name: str
+    ext: str
+    parts: tuple
+    bpm: Optional[str]
+    key: Optional[str]
+    is_correct: bool
+
+@functools.lru_cache(maxsize=8192)
+def _parse_name(name):
+    """Split and scan a name without extension; returns (parts, bpm, key, is_correct).
+
+    Cached because libraries often hold the same track name in several folders
+    (per-crate copies, format duplicates), and the result is immutable.
+    """
+    # No name.count(' - ') early reject here: a name that can't be correct is
+    # one that gets renamed, and the rename needs the parts anyway
+    parts = tuple(name.split(' - '))
     
-    if len(parts) < 4:
-        return False
+    # Correct format: Artist - Title - Key - BPM, with a valid key and BPM last
+    is_correct = len(parts) >= 4 and _is_key(parts[-2].strip()) and _is_bpm(parts[-1].strip())
     
-    # The last two parts should be key and BPM
-    key = parts[-2].strip()
-    bpm = parts[-1].strip()
+    # Check if it has any BPM pattern
+    bpm = key = None
+    if not is_correct:
+        bpm_match = _BPM_RE.search(name)
+        key_match = _KEYWORD_RE.search(name)
+        bpm = bpm_match.group(1) if bpm_match else None
+        key = key_match.group(1) if key_match else None
     
-    # Validate key format (like 8A, 12B, etc.)
-    if not re.match(r'^\d{1,2}[AB]$', key):
-        return False
+    return parts, bpm, key, is_correct
+
+class RenameRec(NamedTuple):
+    """A suggested rename for one file, as yielded by iter_renames."""
+    old_path: str
+    new_path: str
+    old_name: str
+    new_name: str
+    issues: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+
+def _classify(filename, ext=None):
+    """Split and scan a filename once for the format check and rename."""
+    if ext is None:
+        name, ext = os.path.splitext(filename)
+    else:
+        name = filename[:len(filename) - len(ext)]
     
-    # Validate BPM format (numeric, typically 80-200)
-    bpm_clean = re.sub(r'[^\d.]', '', bpm)
-    if not (bpm_clean and bpm_clean.replace('.', '').isdigit()):
+    return ClassifyResult(name, ext, *_parse_name(name))
+
+def is_correct_format(filename):
+    """Check if filename is already in correct format: Artist - Title - Key - BPM.ext"""
+    # Fewer than three separators can't give four parts; skip the split
+    if os.path.splitext(filename)[0].count(' - ') < 3:
         return False
-    
-    return True
+    return _classify(filename).is_correct
 
-def extract_bpm_key_from_metadata(filepath):
-    """Try to extract BPM and key from file metadata."""
-    try:
-        tag = TinyTag.get(filepath)
-        return None, None  # Placeholder - metadata extraction is tagger-dependent
-    except:
-        return None, None
-
-def analyze_filename_pattern(filename):
-    """Analyze what's wrong with the filename and suggest fixes."""
-    name, ext = os.path.splitext(filename)
-    
+def _find_issues(result):
+    """Describe what's wrong with a classified filename and suggest fixes."""
     issues = []
     suggestions = []
     
-    # Check if it has any BPM pattern
-    bpm_match = re.search(r'\b(\d{2,3})\b', name)
-    key_match = re.search(r'\b(\d{1,2}[AB])\b', name)
+    parts = result.parts
+    bpm = result.bpm
+    key = result.key
     
-    parts = name.split(' - ')
+    if result.is_correct:
+        return issues, suggestions  # Actually correct format
     
     if len(parts) < 2:
         issues.append("Missing artist-title separation")
         suggestions.append("Add ' - ' between artist and title")
     elif len(parts) == 2:
-        if not bpm_match and not key_match:
+        if not bpm and not key:
             issues.append("Missing key and BPM")
             suggestions.append("Add ' - KEY - BPM' at the end")
-        elif not bpm_match:
+        elif not bpm:
             issues.append("Missing BPM")
             suggestions.append("Add BPM after key")
-        elif not key_match:
+        elif not key:
             issues.append("Missing key")
             suggestions.append("Add key before BPM")
     elif len(parts) == 3:
-        if not bpm_match:
+        if not bpm:
             issues.append("Missing BPM")
-        elif not key_match:
+        elif not key:
             issues.append("Missing key")
         else:
             issues.append("Has key and BPM but wrong number of segments")
-    elif len(parts) >= 4:
-        # Check if last two parts are key and BPM (correct format)
-        key_part = parts[-2].strip()
-        bpm_part = parts[-1].strip()
-        
-        key_valid = re.match(r'^\d{1,2}[AB]$', key_part)
-        bpm_clean = re.sub(r'[^\d.]', '', bpm_part)
-        bpm_valid = bpm_clean and bpm_clean.replace('.', '').isdigit()
-        
-        if key_valid and bpm_valid:
-            return [], [], bpm_match, key_match  # Actually correct format
-        else:
-            if not key_valid:
-                issues.append("Invalid key format in expected position")
-            if not bpm_valid:
-                issues.append("Invalid BPM format in expected position")
+    else:
+        # Four or more parts, so the last two are not a valid key and BPM
+        if not _is_key(parts[-2].strip()):
+            issues.append("Invalid key format in expected position")
+        if not _is_bpm(parts[-1].strip()):
+            issues.append("Invalid BPM format in expected position")
     
-    return issues, suggestions, bpm_match, key_match
+    return issues, suggestions
 
-def suggest_rename(filepath, default_key="8A", default_bpm="120"):
-    """Suggest a standardized filename."""
-    directory = os.path.dirname(filepath)
-    filename = os.path.basename(filepath)
-    name, ext = os.path.splitext(filename)
-    
-    # Try to extract metadata first
-    try:
-        tag = TinyTag.get(filepath)
-        meta_artist = tag.artist
-        meta_title = tag.title
-    except:
-        meta_artist = None
-        meta_title = None
+def _build_rename(result, entry, directory, default_key="8A", default_bpm="120"):
+    """Suggest a standardized name for a file from its classify result.
+
+    directory is the folder the walker found entry in, so no path is reparsed.
+    Returns (new_name, new_path, issues, suggestions).
+    """
+    name = result.name
+    ext = result.ext
     
     # Analyze current filename
-    issues, suggestions, bpm_match, key_match = analyze_filename_pattern(filename)
+    issues, suggestions = _find_issues(result)
     
-    parts = name.split(' - ')
+    parts = result.parts
     
     # Extract BPM and key if present
-    extracted_bpm = bpm_match.group(1) if bpm_match else default_bpm
-    extracted_key = key_match.group(1) if key_match else default_key
+    extracted_bpm = result.bpm or default_bpm
+    extracted_key = result.key or default_key
     
     # Determine artist and title based on file structure
     if len(parts) >= 4:
@@ -118,14 +155,14 @@ def suggest_rename(filepath, default_key="8A", default_bpm="120"):
         potential_key = parts[-2].strip()
         potential_bpm = parts[-1].strip()
         
-        if (re.match(r'^\d{1,2}[AB]$', potential_key) and 
-            re.search(r'\d+', potential_bpm)):
+        if (_is_key(potential_key) and 
+            _DIGITS_RE.search(potential_bpm)):
             # Last two are key/BPM, everything before is artist and title
             artist = parts[0].strip()
             title_parts = parts[1:-2]  # Everything between artist and key/BPM
             title = ' - '.join(title_parts) if title_parts else "Unknown Title"
             extracted_key = potential_key
-            extracted_bpm = re.search(r'\d+', potential_bpm).group()
+            extracted_bpm = _DIGITS_RE.search(potential_bpm).group()
         else:
             # Fallback to simple parsing
             artist = parts[0].strip()
@@ -139,12 +176,21 @@ def suggest_rename(filepath, default_key="8A", default_bpm="120"):
         for part in title_parts:
             part = part.strip()
             # Don't remove if it looks like a valid title component
-            if not (re.match(r'^\d{1,2}[AB]$', part) or re.match(r'^\d{2,3}$', part)):
+            if not (_is_key(part) or _BPM_PART_RE.match(part)):
                 clean_title_parts.append(part)
         
         title = ' - '.join(clean_title_parts) if clean_title_parts else parts[1]
     else:
-        # Single part or fallback to metadata
+        # Single part or fallback to metadata; only now is the file opened.
+        # TinyTag picks its parser from the extension; skip duration parsing
+        try:
+            tag = TinyTag.get(entry.path, duration=False)
+            meta_artist = tag.artist
+            meta_title = tag.title
+        except (OSError, TinyTagException):
+            meta_artist = None
+            meta_title = None
+        
         if meta_artist and meta_title:
             artist = meta_artist
             title = meta_title
@@ -153,86 +199,252 @@ def suggest_rename(filepath, default_key="8A", default_bpm="120"):
             title = name
     
     # Clean up artist and title
-    artist = re.sub(r'\s+', ' ', artist).strip()
-    title = re.sub(r'\s+', ' ', title).strip()
+    artist = ' '.join(artist.split())
+    title = ' '.join(title.split())
     
     # Build standardized name - preserve complex titles
     new_name = f"{artist} - {title} - {extracted_key} - {extracted_bpm}{ext}"
     new_path = os.path.join(directory, new_name)
     
-    return new_path, issues, suggestions
+    return new_name, new_path, issues, suggestions
+
+def _iter_audio(path):
+    """Yield (DirEntry, ext, directory) for audio files below path, in os.walk order.
 
-def process_directory(directory, dry_run=True, default_key="8A", default_bpm="120"):
-    """Process all non-standard files in directory."""
+    ext keeps its original case; only the extension is lowercased for the
+    check, not the whole filename. Each directory is listed in full before its
+    files are yielded, so renames applied while walking can't show up again.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                ext = os.path.splitext(entry.name)[1]
+                if ext.lower() in _AUDIO_EXTS:
+                    files.append((entry, ext, path))
+    except OSError:
+        return  # Skip unreadable directories, like os.walk does
+    yield from files
+    for subdir in subdirs:
+        yield from _iter_audio(subdir)
+
+def _process_one(candidate, result, default_key="8A", default_bpm="120"):
+    """Build the rename for a (DirEntry, ext, directory) candidate from _iter_audio.
+
+    result is the candidate's classify result, for a name that is not in the
+    correct format. Returns a (rename, error) tuple.
+    """
+    entry, ext, directory = candidate
+    filename = entry.name
     
-    renames = []
-    errors = []
+    # Suggest rename
+    try:
+        new_name, new_path, issues, suggestions = _build_rename(result, entry, directory,
+                                                                default_key, default_bpm)
+    except Exception as e:
+        return None, f"Error processing {filename}: {str(e)}"
     
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith(('.mp3', '.flac', '.wav', '.aiff', '.aac')):
-                filepath = os.path.join(root, filename)
-                
-                # Check if already in correct format
-                if is_correct_format(filename):
-                    continue  # Skip files already in correct format
-                
-                # Suggest rename
-                try:
-                    new_path, issues, suggestions = suggest_rename(filepath, default_key, default_bpm)
-                    
-                    renames.append({
-                        'old_path': filepath,
-                        'new_path': new_path,
-                        'old_name': filename,
-                        'new_name': os.path.basename(new_path),
-                        'issues': issues,
-                        'suggestions': suggestions
-                    })
-                    
-                except Exception as e:
-                    errors.append(f"Error processing {filename}: {str(e)}")
+    rename = RenameRec(
+        old_path=entry.path,
+        new_path=new_path,
+        old_name=filename,
+        new_name=new_name,
+        issues=tuple(issues),
+        suggestions=tuple(suggestions)
+    )
+    return rename, None
+
+def _pop_result(pending):
+    """Pop the oldest (rename, error) result, waiting if it is still a future."""
+    item = pending.popleft()
+    return item.result() if isinstance(item, Future) else item
+
+def iter_renames(directory, errors, default_key="8A", default_bpm="120"):
+    """Yield a suggested rename for each non-standard file in directory.
+
+    Files are checked as the walk finds them; errors are appended to the
+    errors list as they occur.
+    """
+    process = functools.partial(_process_one, default_key=default_key, default_bpm=default_bpm)
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    window = max_workers * 4
     
-    return renames, errors
+    # Results in walk order: finished (rename, error) tuples, or futures for
+    # the tag reads still running
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for candidate in _iter_audio(directory):
+            entry, ext, _ = candidate
+            result = _classify(entry.name, ext)
+            if result.is_correct:
+                continue  # Skip files already in correct format
+            
+            if len(result.parts) < 2:
+                # Only names without an artist/title split open the file for
+                # tags; that blocks on disk I/O, so threads overlap it. The rest
+                # is string work that the GIL would serialize anyway.
+                pending.append(executor.submit(process, candidate, result))
+            else:
+                pending.append(process(candidate, result))
+            
+            while pending and (len(pending) >= window or not isinstance(pending[0], Future)
+                               or pending[0].done()):
+                rename, error = _pop_result(pending)
+                if rename:
+                    yield rename
+                if error:
+                    errors.append(error)
+        
+        while pending:
+            rename, error = _pop_result(pending)
+            if rename:
+                yield rename
+            if error:
+                errors.append(error)
 
-def apply_renames(renames, confirm_each=True):
-    """Apply the suggested renames."""
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+def _load_renameat2():
+    """Return libc's renameat2 on Linux, or None where it isn't available."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+_renameat2 = _load_renameat2()
+
+def _rename_noreplace(old_path, new_path):
+    """Rename old_path to new_path, raising FileExistsError instead of overwriting.
+
+    On Linux this is a single atomic renameat2(RENAME_NOREPLACE) call; elsewhere,
+    or on filesystems without support for it, it falls back to exists + rename.
+    """
+    if _renameat2 is not None:
+        result = _renameat2(_AT_FDCWD, os.fsencode(old_path), _AT_FDCWD, os.fsencode(new_path),
+                            _RENAME_NOREPLACE)
+        if result == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), old_path, None, new_path)
+    
+    if os.path.exists(new_path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new_path)
+    os.rename(old_path, new_path)
+
+def _format_rename(rename):
+    """The OLD/NEW/Issues block shown for each rename."""
+    return (f"\nOLD: {rename.old_name}\n"
+            f"NEW: {rename.new_name}\n"
+            f"Issues: {', '.join(rename.issues)}\n")
+
+def _try_rename(rename):
+    """Apply one rename; returns (applied, status line)."""
+    try:
+        # Fails instead of overwriting if the target already exists
+        _rename_noreplace(rename.old_path, rename.new_path)
+        return True, "✅ Renamed successfully\n"
+    except FileExistsError:
+        return False, f"⚠️  Target already exists: {rename.new_path}\n"
+    except Exception as e:
+        return False, f"❌ Error renaming: {str(e)}\n"
+
+def _rename_paths(rename):
+    """The source and target of a rename, case-folded for collision checks."""
+    return rename.old_path.casefold(), rename.new_path.casefold()
+
+def _iter_bulk_results(renames, max_workers=8):
+    """Yield (rename, applied, status) in order, renaming up to max_workers files at once.
+
+    A rename waits for everything in flight to finish if its source or target
+    is the source or target of a pending one, so duplicate targets and chains
+    such as a -> b, b -> c resolve exactly as they would one at a time. Paths
+    are compared case-insensitively to cover macOS and Windows filesystems.
+    """
+    pending = collections.deque()
+    busy = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for rename in renames:
+            paths = _rename_paths(rename)
+            if not busy.isdisjoint(paths):
+                while pending:
+                    done, future = pending.popleft()
+                    yield (done,) + future.result()
+                busy.clear()
+            pending.append((rename, executor.submit(_try_rename, rename)))
+            busy.update(paths)
+            if len(pending) >= max_workers * 4:
+                done, future = pending.popleft()
+                busy.difference_update(_rename_paths(done))
+                yield (done,) + future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield (done,) + future.result()
+
+def _apply_bulk(renames):
+    """Apply renames without prompting; rename syscalls run on worker threads."""
+    applied = 0
+    skipped = 0
+    
+    # Output is written from this thread once per file and flushed in batches
+    for count, (rename, ok, status) in enumerate(_iter_bulk_results(renames), 1):
+        sys.stdout.write(_format_rename(rename) + status)
+        if ok:
+            applied += 1
+        else:
+            skipped += 1
+        if count % _FLUSH_EVERY == 0:
+            sys.stdout.flush()
+    
+    sys.stdout.flush()
+    return applied, skipped
+
+def _apply_interactive(renames):
+    """Ask before each rename; answering 'a' applies the rest in bulk."""
     applied = 0
     skipped = 0
     
+    renames = iter(renames)
     for rename in renames:
-        old_path = rename['old_path']
-        new_path = rename['new_path']
-        
-        print(f"\nOLD: {rename['old_name']}")
-        print(f"NEW: {rename['new_name']}")
-        print(f"Issues: {', '.join(rename['issues'])}")
-        
-        if confirm_each:
-            response = input("Apply this rename? (y/n/a for all): ").lower()
-            if response == 'a':
-                confirm_each = False
-            elif response != 'y' and response != 'a':
-                skipped += 1
-                continue
+        sys.stdout.write(_format_rename(rename))
+        response = input("Apply this rename? (y/n/a for all): ").lower()
+        if response != 'y' and response != 'a':
+            skipped += 1
+            continue
         
-        try:
-            # Check if target already exists
-            if os.path.exists(new_path):
-                print(f"⚠️  Target already exists: {new_path}")
-                skipped += 1
-                continue
-                
-            os.rename(old_path, new_path)
-            print(f"✅ Renamed successfully")
+        ok, status = _try_rename(rename)
+        sys.stdout.write(status)
+        if ok:
             applied += 1
-            
-        except Exception as e:
-            print(f"❌ Error renaming: {str(e)}")
+        else:
             skipped += 1
+        
+        if response == 'a':
+            bulk_applied, bulk_skipped = _apply_bulk(renames)
+            return applied + bulk_applied, skipped + bulk_skipped
     
+    sys.stdout.flush()
     return applied, skipped
 
+def apply_renames(renames, confirm_each=True):
+    """Apply the suggested renames."""
+    if confirm_each:
+        return _apply_interactive(renames)
+    return _apply_bulk(renames)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fix music filenames to match 'Artist - Title - Key - BPM.ext' format",
@@ -268,40 +480,59 @@ Handles complex titles: Artist - Title (Remix) (feat. Someone) - Key - BPM.ext
     
     print(f"🔍 Scanning {args.directory} for non-standard music files...")
     
-    renames, errors = process_directory(
-        args.directory, 
-        dry_run=args.dry_run,
+    errors = []
+    renames = iter_renames(
+        args.directory,
+        errors,
         default_key=args.default_key,
         default_bpm=args.default_bpm
     )
     
+    # Peek at the first suggestion so an already clean library skips straight
+    # to the summary, without the apply/preview setup
+    first = next(renames, None)
+    total = 0
+    applied = skipped = 0
+    preview = []
+    if first is not None:
+        renames = itertools.chain((first,), renames)
+        if args.apply:
+            # Renames are applied as they are found, so the totals come last
+            print(f"\n🔧 Applying renames...")
+            applied, skipped = apply_renames(renames, confirm_each=not args.auto_yes)
+            total = applied + skipped
+        else:
+            # Only the first 10 are kept for the preview; the rest are just counted
+            for rename in renames:
+                total += 1
+                if total <= 10:
+                    preview.append(rename)
+    
     if errors:
         print(f"\n❌ Errors encountered:")
         for error in errors:
             print(f"   {error}")
     
-    if not renames:
+    if not total:
         print("✅ All files are already in correct format!")
         return
     
-    print(f"\n📋 Found {len(renames)} files that need renaming:")
-    
-    if args.dry_run and not args.apply:
+    if args.apply:
+        # The total is only known once every rename has been handled
+        print(f"\n✅ Processed {total} files: applied {applied}, skipped {skipped}")
+        
+    elif args.dry_run:
+        print(f"\n📋 Found {total} files that need renaming:")
         print("\n🔍 DRY RUN - No files will be changed:")
-        for i, rename in enumerate(renames[:10], 1):  # Show first 10
-            print(f"\n{i}. {rename['old_name']}")
-            print(f"   → {rename['new_name']}")
-            print(f"   Issues: {', '.join(rename['issues'])}")
+        for i, rename in enumerate(preview, 1):  # Show first 10
+            print(f"\n{i}. {rename.old_name}")
+            print(f"   → {rename.new_name}")
+            print(f"   Issues: {', '.join(rename.issues)}")
         
-        if len(renames) > 10:
-            print(f"\n... and {len(renames) - 10} more files")
+        if total > 10:
+            print(f"\n... and {total - 10} more files")
         
         print(f"\nTo apply changes, run with --apply")
-        
-    elif args.apply:
-        print(f"\n🔧 Applying renames...")
-        applied, skipped = apply_renames(renames, confirm_each=not args.auto_yes)
-        print(f"\n✅ Applied {applied} renames, skipped {skipped}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file